@@ -3,109 +3,128 @@
 # > python sliders_ui.py
 
 import math
-from nicegui import ui   # pip install nicegui
+from nicegui import core, ui   # pip install nicegui
+
+
+# Range bounds in dB, module-level constants so hot call sites skip per-instance lookups
+INTENSITY_LO, INTENSITY_HI = -30, 0     # Hardware can go down to -30dB but UI should stay above -20dB
+SPECTRUM_LO, SPECTRUM_HI = -20, +20
+MOVEMENT_LO, MOVEMENT_HI = -20, 0
+VIBRATION_LO, VIBRATION_HI = -20, 0
 
 
 def to_float(value):
+    if type(value) is float:    # Fast path, sliders already hand us floats
+        return value
     try:
         return float(value)
     except:
-        return float(0) # 0 if any error
+        return 0.0 # 0 if any error
 
 def to_string_db(value):
-    return ("+" if value > 0 else "") + "{:.0f} dB".format(to_float(value)) # Format in dB with no decimals
+    value = to_float(value)
+    return f"+{value:.0f} dB" if value > 0 else f"{value:.0f} dB" # Format in dB with no decimals
+
+# Numeric kernels, kept at module level so Numba can compile them when available
+
+def _compute_mov_vib(intensity, spectrum, mov_lo, mov_hi, vib_lo, vib_hi):  # HW values -> (movement, vibration)
+    # mov = upper - max(diff, 0) and vib = upper + min(diff, 0) cover both signs without branching
+    mov = intensity - (spectrum if spectrum > 0 else 0)     # Movement is lower when diff is positive
+    vib = intensity + (spectrum if spectrum < 0 else 0)     # Vibration is lower when diff is negative
+    mov = min(mov_hi, max(mov_lo, round(mov, 0)))
+    vib = min(vib_hi, max(vib_lo, round(vib, 0)))
+    return mov, vib
+
+def _compute_hw(mov, vib, int_lo, int_hi, spec_lo, spec_hi):    # (movement, vibration) -> HW values
+    upper_db = max(mov, vib)
+    diff_db = vib - mov
+    intensity = min(int_hi, max(int_lo, upper_db))
+    spectrum = min(spec_hi, max(spec_lo, diff_db))
+    return intensity, spectrum
+
+try:
+    from numba import njit   # pip install numba (optional, for JIT-compiled kernels)
+    _compute_mov_vib = njit(cache=True)(_compute_mov_vib)
+    _compute_hw = njit(cache=True)(_compute_hw)
+except:
+    pass    # numba not installed, keep the pure-Python kernels
+
+# The sliders only produce integer dB, so all 21x21 (movement, vibration) states can be precomputed
+# (whole floats hash like their integer value, so float slider values hit the table too)
+_MOV_VIB_TO_HW = {(mov, vib): _compute_hw(mov, vib, INTENSITY_LO, INTENSITY_HI, SPECTRUM_LO, SPECTRUM_HI)
+                  for mov in range(MOVEMENT_LO, MOVEMENT_HI + 1)
+                  for vib in range(VIBRATION_LO, VIBRATION_HI + 1)}
 
-def clip(value, min, max):
-    if value < min:
-        value = min
-    if value > max:
-        value = max
-    return value
 
 class Settings:
+    # Fixed attribute layout: slot access is a fixed-offset fetch instead of a __dict__ lookup
+    # intensity/spectrum/movement/vibration are plain attributes (push model): the UI bindings read
+    # them directly, and apply_*() performs validated writes that refresh the derived values
+    __slots__ = ('intensity', 'spectrum', 'movement', 'vibration', '_logger', '_debounce')
+
+    DEBOUNCE_SECONDS = 0.03     # Coalesce slider drag events, only the trailing value is applied
+
     def __init__(self):
         # These 2 values mimic the hardware persistent settings, UI values are computed from them
-        self._intensity = 0
-        self._spectrum = 0
-        # Helper settings
-        self.INTENSITY_RANGE = [-30, 0]     # Hardware can go down to -30dB but UI should stay above -20dB
-        self.SPECTRUM_RANGE = [-20, +20]
-        self.MOVEMENT_RANGE = [-20, 0]
-        self.VIBRATION_RANGE = [-20, 0]
+        self.intensity = 0
+        self.spectrum = 0
+        self._debounce = {}     # Pending debounce timer per setting name
         self.set_logger(None)
+        self._recompute_derived()   # Fill movement/vibration from the HW values
 
     def set_logger(self, callback):
         self._logger = callback
 
-    def log(self, text):
-        if self._logger:
-            self._logger(str(text))
+    def log(self, text):        # Accepts a string or a zero-arg callable, only evaluated when a logger is attached
+        if self._logger is None:
+            return
+        self._logger(text() if callable(text) else str(text))
+
+    # Write paths (reads are plain attribute fetches, no descriptor involved)
 
-    # Read properties
+    def schedule(self, name, value):    # Debounced write, only the trailing value of a burst is applied
+        apply = getattr(self, 'apply_' + name)
+        timer = self._debounce.pop(name, None)
+        if timer:
+            timer.cancel()      # A newer value superseded the pending one
+        if core.loop is None:   # No UI event loop running, a timer would never fire
+            apply(value)        # Programmatic write, apply immediately
+        else:
+            self._debounce[name] = ui.timer(self.DEBOUNCE_SECONDS, lambda: apply(value), once=True)
 
-    @property
-    def intensity(self):        # Get direct HW intensity
-        return self._intensity
+    def apply_intensity(self, value):   # Set direct HW intensity (with validation)
+        self.intensity = min(INTENSITY_HI, max(INTENSITY_LO, value))
+        self._recompute_derived()
+        self.log(lambda: f"Intensity set to {self.intensity}")
 
-    @property
-    def spectrum(self):         # Get direct HW spectrum
-        return self._spectrum
+    def apply_spectrum(self, value):    # Set direct HW spectrum (with validation)
+        self.spectrum = min(SPECTRUM_HI, max(SPECTRUM_LO, value))
+        self._recompute_derived()
+        self.log(lambda: f"Spectrum set to {self.spectrum}")
 
-    @property
-    def movement(self):         # Get computed UI movement dB from HW values
-        upper_db = self._intensity
-        diff_db = self._spectrum
-        if diff_db < 0:            
-            mov = upper_db              # Movement is upper
-        else:
-            mov = upper_db - diff_db    # Movement is lower (positive diff)
-        return clip(round(mov, 0), *self.MOVEMENT_RANGE)
-
-    @property
-    def vibration(self):         # Get computed UI vibration dB 
-        upper_db = self._intensity
-        diff_db = self._spectrum
-        if diff_db < 0:            
-            vib = upper_db + diff_db    # Vibration is lower (negative diff)
-        else:                   
-            vib = upper_db              # Vibration is upper
-        return clip(round(vib, 0), *self.VIBRATION_RANGE)
-
-    # Write properties
-
-    @intensity.setter
-    def intensity(self, value):     # Set direct HW intensity (with validation)
-        self._intensity = clip(value, *self.INTENSITY_RANGE)
-        self.log("Intensity set to " + str(self._intensity))
-
-    @spectrum.setter
-    def spectrum(self, value):      # Set direct HW spectrum (with validation)
-        self._spectrum = clip(value, *self.SPECTRUM_RANGE)
-        self.log("Spectrum set to " + str(self._spectrum))
-
-    @movement.setter
-    def movement(self, value):      # Set HW values to get desired computed UI movement dB
-        self.log("Updating movement to " + str(value))
-        mov = value  
-        vib = self.vibration        # get current computed vibration
-        self._set_from_mov_vib(mov, vib)
-
-    @vibration.setter
-    def vibration(self, value):     # Set HW values to get desired computed UI vibration dB
-        self.log("Updating vibration to " + str(value))
-        mov = self.movement         # get current computed movement
-        vib = value
-        self._set_from_mov_vib(mov, vib)
+    def apply_movement(self, value):    # Set HW values to get desired UI movement dB
+        self.log(lambda: f"Updating movement to {value}")
+        self._set_from_mov_vib(value, self.vibration)   # vibration is held at its last committed value
+
+    def apply_vibration(self, value):   # Set HW values to get desired UI vibration dB
+        self.log(lambda: f"Updating vibration to {value}")
+        self._set_from_mov_vib(self.movement, value)    # movement is held at its last committed value
 
     def _set_from_mov_vib(self, mov, vib):
-        upper_db = max(mov, vib)
-        diff_db = vib - mov
         # set intensity and spectrum with validation (clip)
-        self._intensity = clip(upper_db, *self.INTENSITY_RANGE)
-        self._spectrum = clip(diff_db, *self.SPECTRUM_RANGE)
-        self.log("  Intensity set to " + str(self._intensity))
-        self.log("  Spectrum set to " + str(self._spectrum))
-        
+        hw = _MOV_VIB_TO_HW.get((mov, vib))
+        if hw is None:      # non-integer or out-of-range input, fall back to the kernel
+            hw = _compute_hw(mov, vib, INTENSITY_LO, INTENSITY_HI, SPECTRUM_LO, SPECTRUM_HI)
+        self.intensity, self.spectrum = hw
+        self._recompute_derived()
+        self.log(lambda: f"  Intensity set to {self.intensity}")
+        self.log(lambda: f"  Spectrum set to {self.spectrum}")
+
+    def _recompute_derived(self):   # Push the UI values derived from the HW values
+        self.movement, self.vibration = _compute_mov_vib(
+            self.intensity, self.spectrum,
+            MOVEMENT_LO, MOVEMENT_HI, VIBRATION_LO, VIBRATION_HI)
+
 
 # Prepare UI
 def prep_ui(settings):
@@ -114,22 +133,26 @@ def prep_ui(settings):
         with ui.row().classes('w-full justify-between'):
             ui.label('Hardware Intensity:')
             ui.label().bind_text_from(settings, 'intensity', backward=to_string_db)
-        ui.slider(min=-20, max=0, step=1).bind_value(settings, 'intensity')
+        ui.slider(min=-20, max=0, step=1).on('update:model-value',     # client-originated only, binding echoes don't fire it
+                  lambda e: settings.schedule('intensity', e.args)).bind_value_from(settings, 'intensity')
         with ui.row().classes('w-full justify-between'):
             ui.label('Hardware Spectrum:')
             ui.label().bind_text_from(settings, 'spectrum', backward=to_string_db)
-        ui.slider(min=-20, max=20, step=1).bind_value(settings, 'spectrum')
+        ui.slider(min=-20, max=20, step=1).on('update:model-value',
+                  lambda e: settings.schedule('spectrum', e.args)).bind_value_from(settings, 'spectrum')
 
     with ui.card().classes('w-96'):
         ui.label('UI Settings').classes('text-h6')
         with ui.row().classes('w-full justify-between'):
             ui.label('UI Movement Intensity (dB)')
             ui.label().bind_text_from(settings, 'movement', backward=to_string_db)
-        ui.slider(min=-20, max=0, step=1).bind_value(settings, 'movement')
+        ui.slider(min=-20, max=0, step=1).on('update:model-value',
+                  lambda e: settings.schedule('movement', e.args)).bind_value_from(settings, 'movement')
         with ui.row().classes('w-full justify-between'):
             ui.label('UI Vibration Intensity (dB)')
             ui.label().bind_text_from(settings, 'vibration', backward=to_string_db)
-        ui.slider(min=-20, max=0, step=1).bind_value(settings, 'vibration')
+        ui.slider(min=-20, max=0, step=1).on('update:model-value',
+                  lambda e: settings.schedule('vibration', e.args)).bind_value_from(settings, 'vibration')
 
     with ui.card().classes('w-96'):
         ui.label('Log').classes('text-h6')